@@ -10,12 +10,9 @@ from requests.auth import AuthBase
 from requests.cookies import RequestsCookieJar as CookieJar
 from robot.api import SkipExecution
 from robot.api.deco import keyword, library
-from robot.libraries.BuiltIn import BuiltIn
 
 from OpenApiLibCore import OpenApiLibCore, RequestData, RequestValues, ValidationLevel
-
-run_keyword = BuiltIn().run_keyword
-
+from OpenApiLibCore.openapi_libcore import run_keyword
 
 logger = getLogger(__name__)
 
@@ -124,9 +124,9 @@ import sys
 from copy import deepcopy
 from dataclasses import Field, dataclass, field, make_dataclass
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, lru_cache
 from itertools import zip_longest
-from logging import getLogger
+from logging import DEBUG, getLogger
 from pathlib import Path
 from random import choice, sample
 from typing import (
@@ -149,7 +149,12 @@ from openapi_core.contrib.requests import (
     RequestsOpenAPIResponse,
 )
 from openapi_core.exceptions import OpenAPIError
-from openapi_core.templating.paths.exceptions import ServerNotFound
+from openapi_core.templating.paths.exceptions import (
+    OperationNotFound,
+    PathNotFound,
+    ServerNotFound,
+)
+from openapi_core.templating.responses.exceptions import ResponseNotFound
 from openapi_core.validation.exceptions import ValidationError
 from openapi_core.validation.response.exceptions import ResponseValidationError
 from openapi_core.validation.schemas.exceptions import InvalidSchemaValue
@@ -181,9 +186,19 @@ from OpenApiLibCore.dto_utils import (
     get_id_property_name,
 )
 from OpenApiLibCore.oas_cache import PARSER_CACHE
-from OpenApiLibCore.value_utils import FAKE, IGNORE, JSON
+from OpenApiLibCore.value_utils import FAKE, IGNORE, JSON, PYTHON_TYPE_BY_JSON_TYPE_NAME
+
+
+@lru_cache(maxsize=None)
+def _get_builtin() -> BuiltIn:
+    # BuiltIn is created on first use instead of when this module is imported
+    return BuiltIn()
+
+
+def run_keyword(*args: Any) -> Any:
+    """Run the keyword through Robot Framework so it can be overridden by users."""
+    return _get_builtin().run_keyword(*args)
 
-run_keyword = BuiltIn().run_keyword
 
 logger = getLogger(__name__)
 
@@ -197,18 +212,90 @@ class ValidationLevel(str, Enum):
     STRICT = "STRICT"
 
 
+UNSAFE_KEY_CHARACTERS = str.maketrans("-@", "__")
+
+
+@lru_cache(maxsize=None)
 def get_safe_key(key: str) -> str:
     """
     Helper function to convert a valid JSON property name to a string that can be used
     as a Python variable or function / method name.
     """
-    key = key.replace("-", "_")
-    key = key.replace("@", "_")
+    key = key.translate(UNSAFE_KEY_CHARACTERS)
     if key[0].isdigit():
         key = f"_{key}"
     return key
 
 
+def _get_json(response: Response) -> Any:
+    """
+    Return the json content of the response. The decoded content is stored on the
+    response, so the validations performed on the same response decode it only once.
+    """
+    response_attributes = vars(response)
+    if "_json_content" not in response_attributes:
+        response_attributes["_json_content"] = response.json()
+    return response_attributes["_json_content"]
+
+
+def _allows_any_properties(schema: Dict[str, Any]) -> bool:
+    """
+    Return whether any resource satisfies the property constraints of the schema,
+    i.e. no properties are required and additional properties of any type are allowed.
+    """
+    return schema.get("additionalProperties", True) is True and not schema.get(
+        "required"
+    )
+
+
+def _get_python_type_to_validate(expected_type: str) -> Type[Any]:
+    """Return the Python type for the json type, if its validation is supported."""
+    python_type = PYTHON_TYPE_BY_JSON_TYPE_NAME.get(expected_type, None)
+    if python_type is None:
+        raise AssertionError(f"Validation of type '{expected_type}' is not supported.")
+    return python_type
+
+
+def _get_deletion_check_method(path_item: Dict[str, Any]) -> str:
+    """
+    Return the method used to check the resource after a DELETE. Only the status_code
+    of the response is relevant, so HEAD is used if the path supports it to avoid
+    downloading the response body. GET is the fallback since many servers respond
+    to an undocumented HEAD with a 405.
+    """
+    return "HEAD" if "head" in path_item else "GET"
+
+
+@dataclass(frozen=True)
+class _ResponseDetails:
+    """Helper class to hold the pre-resolved details of a response in the spec."""
+
+    content_types: List[str]
+    content_type: str = ""
+    mime_type: str = ""
+    schema: Dict[str, Any] = field(default_factory=dict)
+
+
+def _resolve_response_details(response_spec: Dict[str, Any]) -> _ResponseDetails:
+    """Return the (resolved) details needed to validate a response for the spec."""
+    if not (content := response_spec.get("content")):
+        return _ResponseDetails(content_types=[])
+    # multiple content types can be specified in the OAS
+    content_types = list(content.keys())
+    supported_types = [
+        ct for ct in content_types if ct.partition(";")[0].endswith("json")
+    ]
+    if not supported_types:
+        return _ResponseDetails(content_types=content_types)
+    content_type = supported_types[0]
+    return _ResponseDetails(
+        content_types=content_types,
+        content_type=content_type,
+        mime_type=content_type.split(";", 1)[0].lower(),
+        schema=resolve_schema(content[content_type].get("schema", {})),
+    )
+
+
 @dataclass
 class RequestValues:
     """Helper class to hold parameter values needed to make a request."""
@@ -609,7 +696,8 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         self._source = source
         self._origin = origin
         self._base_path = base_path
-        self.response_validation = response_validation
+        # converted so the validation level can be compared by identity
+        self.response_validation = ValidationLevel(response_validation)
         self.disable_server_validation = disable_server_validation
         self._recursion_limit = recursion_limit
         self._recursion_default = recursion_default
@@ -659,6 +747,7 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         # update the globally available DEFAULT_ID_PROPERTY_NAME to the provided value
         DEFAULT_ID_PROPERTY_NAME.id_property_name = default_id_property_name
         self._server_validation_warning_logged = False
+        self._response_details: Dict[Tuple[str, str, str], _ResponseDetails] = {}
 
     @property
     def origin(self) -> str:
@@ -813,6 +902,9 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
                 }
                 config = Config(extra_media_type_deserializers=extra_deserializers)
                 openapi = OpenAPI(spec=validation_spec, config=config)
+                # The OpenAPI instance creates its response validator on first use
+                # and reuses it after that, so by caching the bound method, the
+                # validator is only built once for all Suites using this `source`.
                 response_validator = openapi.validate_response
 
                 PARSER_CACHE[self._source] = (
@@ -860,7 +952,7 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         try:
             # endpoint can be partially resolved or provided by a PathPropertiesConstraint
             parametrized_endpoint = self.get_parametrized_endpoint(endpoint=endpoint)
-            _ = self.openapi_spec["paths"][parametrized_endpoint]
+            _ = self._openapi_spec["paths"][parametrized_endpoint]
         except KeyError:
             raise ValueError(
                 f"{endpoint} not found in paths section of the OpenAPI document."
@@ -1030,7 +1122,8 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         spec_endpoint = self.get_parametrized_endpoint(endpoint)
         dto_class = self.get_dto_class(endpoint=spec_endpoint, method=method)
         try:
-            method_spec = self.openapi_spec["paths"][spec_endpoint][method]
+            # protect the parsed openapi spec from being mutated by reference
+            method_spec = deepcopy(self._openapi_spec["paths"][spec_endpoint][method])
         except KeyError:
             logger.info(
                 f"method '{method}' not supported on '{spec_endpoint}, using empty spec."
@@ -1120,8 +1213,13 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         """Get the methods parameter spec and params and headers with valid data."""
         parameters = method_spec.get("parameters", [])
         parameter_relations = dto_class.get_parameter_relations()
-        query_params = [p for p in parameters if p.get("in") == "query"]
-        header_params = [p for p in parameters if p.get("in") == "header"]
+        query_params: List[Dict[str, Any]] = []
+        header_params: List[Dict[str, Any]] = []
+        for parameter in parameters:
+            if (location := parameter.get("in")) == "query":
+                query_params.append(parameter)
+            elif location == "header":
+                header_params.append(parameter)
         params = self.get_parameter_data(query_params, parameter_relations)
         headers = self.get_parameter_data(header_params, parameter_relations)
         return parameters, params, headers
@@ -1172,7 +1270,7 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         if endpoint_parts[-1] == "":
             _ = endpoint_parts.pop(-1)
 
-        spec_endpoints: List[str] = {**self.openapi_spec}["paths"].keys()
+        spec_endpoints: List[str] = self._openapi_spec["paths"].keys()
 
         candidates: List[str] = []
 
@@ -1482,7 +1580,7 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         parameters_to_ignore = {
             r.property_name
             for r in relations_for_status_code
-            if r.invalid_value_error_code == status_code and r.invalid_value == IGNORE
+            if r.invalid_value_error_code == status_code and r.invalid_value is IGNORE
         }
         relation_property_names = {r.property_name for r in relations_for_status_code}
         if not relation_property_names:
@@ -1797,7 +1895,7 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         )
         if response.status_code != status_code:
             try:
-                response_json = response.json()
+                response_json = _get_json(response)
             except Exception as _:  # pylint: disable=broad-except
                 logger.info(
                     f"Failed to get json content from response. "
@@ -1813,10 +1911,12 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
                     )
                 logger.error(f"{response.reason}: {description}")
 
-            logger.debug(
-                f"\nSend: {_json.dumps(request_values.json_data, indent=4, sort_keys=True)}"
-                f"\nGot: {_json.dumps(response_json, indent=4, sort_keys=True)}"
-            )
+            # pretty-printing the json is only worth the effort if it will be logged
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(
+                    f"\nSend: {_json.dumps(request_values.json_data, indent=4, sort_keys=True)}"
+                    f"\nGot: {_json.dumps(response_json, indent=4, sort_keys=True)}"
+                )
             raise AssertionError(
                 f"Response status_code {response.status_code} was not {status_code}"
             )
@@ -1824,11 +1924,18 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         run_keyword("validate_response", path, response, original_data)
 
         if request_values.method == "DELETE":
-            get_request_data = self.get_request_data(endpoint=path, method="GET")
+            get_method = _get_deletion_check_method(
+                self._openapi_spec["paths"].get(path, {})
+            )
+            get_request_data = self.get_request_data(endpoint=path, method=get_method)
             get_params = get_request_data.params
             get_headers = get_request_data.headers
             get_response = run_keyword(
-                "authorized_request", request_values.url, "GET", get_params, get_headers
+                "authorized_request",
+                request_values.url,
+                get_method,
+                get_params,
+                get_headers,
             )
             if response.ok:
                 if get_response.ok:
@@ -1882,44 +1989,41 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
             )
             return None
 
-        response_spec = self._get_response_spec(
-            path=path,
-            method=request_method,
-            status_code=response.status_code,
-        )
+        # with DISABLED response_validation, the spec may not have been checked yet
+        try:
+            response_details = self._get_response_details(
+                path=path,
+                method=request_method,
+                status_code=response.status_code,
+            )
+        except OpenAPIError as exception:
+            raise Failure(f"Response did not pass schema validation: {exception}")
 
         content_type_from_response = response.headers.get("Content-Type", "unknown")
-        mime_type_from_response, _, _ = content_type_from_response.partition(";")
+        # media types are case-insensitive, the index holds the lowercase mime_type
+        mime_type_from_response = content_type_from_response.split(";", 1)[0].lower()
 
-        if not response_spec.get("content"):
+        if not response_details.content_types:
             logger.warning(
                 "The response cannot be validated: 'content' not specified in the OAS."
             )
             return None
 
-        # multiple content types can be specified in the OAS
-        content_types = list(response_spec["content"].keys())
-        supported_types = [
-            ct for ct in content_types if ct.partition(";")[0].endswith("json")
-        ]
-        if not supported_types:
+        if not response_details.content_type:
             raise NotImplementedError(
-                f"The content_types '{content_types}' are not supported. "
-                f"Only json types are currently supported."
+                f"The content_types '{response_details.content_types}' are not "
+                f"supported. Only json types are currently supported."
             )
-        content_type = supported_types[0]
-        mime_type = content_type.partition(";")[0]
 
-        if mime_type != mime_type_from_response:
+        if response_details.mime_type != mime_type_from_response:
             raise ValueError(
                 f"Content-Type '{content_type_from_response}' of the response "
-                f"does not match '{mime_type}' as specified in the OpenAPI document."
+                f"does not match '{response_details.mime_type}' as specified in the "
+                f"OpenAPI document."
             )
 
-        json_response = response.json()
-        response_schema = resolve_schema(
-            response_spec["content"][content_type]["schema"]
-        )
+        json_response = _get_json(response)
+        response_schema = response_details.schema
 
         response_types = response_schema.get("types")
         if response_types:
@@ -1939,15 +2043,26 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
                 )
             type_of_list_items = list_item_schema.get("type")
             if type_of_list_items == "object":
-                for resource in json_response:
-                    run_keyword(
-                        "validate_resource_properties", resource, list_item_schema
+                if not _allows_any_properties(list_item_schema):
+                    # Validated directly instead of through run_keyword since this
+                    # runs for each item in the list; the validation of a single
+                    # resource below is dispatched so it can be overridden.
+                    schema_properties = list_item_schema.get("properties", {})
+                    required_properties = list_item_schema.get("required", [])
+                    additional_properties = list_item_schema.get(
+                        "additionalProperties", True
                     )
+                    for resource in json_response:
+                        self._validate_properties(
+                            resource=resource,
+                            schema_properties=schema_properties,
+                            required_properties=required_properties,
+                            additional_properties=additional_properties,
+                        )
             else:
-                for item in json_response:
-                    self._validate_value_type(
-                        value=item, expected_type=type_of_list_items
-                    )
+                self._validate_type_of_list_items(
+                    items=json_response, expected_type=type_of_list_items
+                )
             # no further validation; value validation of individual resources should
             # be performed on the endpoints for the specific resource
             return None
@@ -1969,11 +2084,39 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         params = request_data.params
         headers = request_data.headers
         get_response = run_keyword("authorized_request", url, "GET", params, headers)
+        get_json = _get_json(get_response)
         assert (
-            get_response.json() == json_response
-        ), f"{get_response.json()} not equal to original {json_response}"
+            get_json == json_response
+        ), f"{get_json} not equal to original {json_response}"
+
+    def _get_response_details(
+        self, path: str, method: str, status_code: int
+    ) -> _ResponseDetails:
+        # the details are resolved on first use and stored per path, method and status
+        key = (path, method.lower(), str(status_code))
+        if (response_details := self._response_details.get(key)) is None:
+            path, method, status = key
+            if (path_item := self._openapi_spec["paths"].get(path)) is None:
+                raise PathNotFound(url=path)
+            if (operation := path_item.get(method)) is None:
+                raise OperationNotFound(url=path, method=method)
+            responses = operation["responses"]
+            if (response_spec := responses.get(status)) is None:
+                raise ResponseNotFound(
+                    http_status=status, availableresponses=list(responses)
+                )
+            response_details = _resolve_response_details(response_spec)
+            self._response_details[key] = response_details
+        return response_details
 
     def _validate_response_against_spec(self, response: Response) -> None:
+        # Errors are discarded for DISABLED, except for the debug logging of errors
+        # for responses with the invalid_property_default_response status_code
+        if (
+            self.response_validation is ValidationLevel.DISABLED
+            and response.status_code != self.invalid_property_default_response
+        ):
+            return
         try:
             self.validate_response_vs_spec(
                 request=RequestsOpenAPIRequest(response.request),
@@ -2007,12 +2150,12 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
             if response.status_code == self.invalid_property_default_response:
                 logger.debug(error_message)
                 return
-            if self.response_validation == ValidationLevel.STRICT:
+            if self.response_validation is ValidationLevel.STRICT:
                 logger.error(error_message)
                 raise exception
-            if self.response_validation == ValidationLevel.WARN:
+            if self.response_validation is ValidationLevel.WARN:
                 logger.warning(error_message)
-            elif self.response_validation == ValidationLevel.INFO:
+            elif self.response_validation is ValidationLevel.INFO:
                 logger.info(error_message)
 
     @keyword
@@ -2023,15 +2166,34 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         Validate that the `resource` does not contain any properties that are not
         defined in the `schema_properties`.
         """
-        schema_properties = schema.get("properties", {})
-        property_names_from_schema = set(schema_properties.keys())
-        property_names_in_resource = set(resource.keys())
+        if _allows_any_properties(schema):
+            return
 
-        if property_names_from_schema != property_names_in_resource:
+        self._validate_properties(
+            resource=resource,
+            schema_properties=schema.get("properties", {}),
+            required_properties=schema.get("required", []),
+            additional_properties=schema.get("additionalProperties", True),
+        )
+
+    def _validate_properties(
+        self,
+        resource: Dict[str, Any],
+        schema_properties: Dict[str, Any],
+        required_properties: List[str],
+        additional_properties: Union[bool, Dict[str, Any]],
+    ) -> None:
+        missing_properties = [
+            name for name in required_properties if name not in resource
+        ]
+        extra_property_names = [
+            name for name in resource if name not in schema_properties
+        ]
+
+        if extra_property_names:
             # The additionalProperties property determines whether properties with
             # unspecified names are allowed. This property can be boolean or an object
             # (dict) that specifies the type of any additional properties.
-            additional_properties = schema.get("additionalProperties", True)
             if isinstance(additional_properties, bool):
                 allow_additional_properties = additional_properties
                 allowed_additional_properties_type = None
@@ -2039,81 +2201,59 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
                 allow_additional_properties = True
                 allowed_additional_properties_type = additional_properties["type"]
 
-            extra_property_names = property_names_in_resource.difference(
-                property_names_from_schema
-            )
             if allow_additional_properties:
                 # If a type is defined for extra properties, validate them
                 if allowed_additional_properties_type:
                     extra_properties = {
-                        key: value
-                        for key, value in resource.items()
-                        if key in extra_property_names
+                        key: resource[key] for key in extra_property_names
                     }
                     self._validate_type_of_extra_properties(
                         extra_properties=extra_properties,
                         expected_type=allowed_additional_properties_type,
                     )
                 # If allowed, validation should not fail on extra properties
-                extra_property_names = set()
+                extra_property_names = []
 
-            required_properties = set(schema.get("required", []))
-            missing_properties = required_properties.difference(
-                property_names_in_resource
+        if extra_property_names or missing_properties:
+            extra = (
+                f"\n\tExtra properties in response: {set(extra_property_names)}"
+                if extra_property_names
+                else ""
+            )
+            missing = (
+                f"\n\tRequired properties missing in response: {set(missing_properties)}"
+                if missing_properties
+                else ""
+            )
+            raise AssertionError(
+                f"Response schema violation: the response contains properties that are "
+                f"not specified in the schema or does not contain properties that are "
+                f"required according to the schema."
+                f"\n\tReceived in the response: {set(resource)}"
+                f"\n\tDefined in the schema:    {set(schema_properties)}"
+                f"{extra}{missing}"
             )
-
-            if extra_property_names or missing_properties:
-                extra = (
-                    f"\n\tExtra properties in response: {extra_property_names}"
-                    if extra_property_names
-                    else ""
-                )
-                missing = (
-                    f"\n\tRequired properties missing in response: {missing_properties}"
-                    if missing_properties
-                    else ""
-                )
-                raise AssertionError(
-                    f"Response schema violation: the response contains properties that are "
-                    f"not specified in the schema or does not contain properties that are "
-                    f"required according to the schema."
-                    f"\n\tReceived in the response: {property_names_in_resource}"
-                    f"\n\tDefined in the schema:    {property_names_from_schema}"
-                    f"{extra}{missing}"
-                )
 
     @staticmethod
     def _validate_value_type(value: Any, expected_type: str) -> None:
-        type_mapping = {
-            "string": str,
-            "number": float,
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-        python_type = type_mapping.get(expected_type, None)
-        if python_type is None:
-            raise AssertionError(
-                f"Validation of type '{expected_type}' is not supported."
-            )
+        python_type = _get_python_type_to_validate(expected_type)
         if not isinstance(value, python_type):
             raise AssertionError(f"{value} is not of type {expected_type}")
 
+    @staticmethod
+    def _validate_type_of_list_items(items: List[Any], expected_type: str) -> None:
+        if not items:
+            return
+        python_type = _get_python_type_to_validate(expected_type)
+        for item in items:
+            if not isinstance(item, python_type):
+                raise AssertionError(f"{item} is not of type {expected_type}")
+
     @staticmethod
     def _validate_type_of_extra_properties(
         extra_properties: Dict[str, Any], expected_type: str
     ) -> None:
-        type_mapping = {
-            "string": str,
-            "number": float,
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-
-        python_type = type_mapping.get(expected_type, None)
+        python_type = PYTHON_TYPE_BY_JSON_TYPE_NAME.get(expected_type, None)
         if python_type is None:
             logger.warning(
                 f"Additonal properties were not validated: "
@@ -2201,7 +2341,7 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         else:
             send_json = _json.loads(response.request.body)
 
-        response_data = response.json()
+        response_data = _get_json(response)
         # POST on /resource_type/{id}/array_item/ will return the updated {id} resource
         # instead of a newly created resource. In this case, the send_json must be
         # in the array of the 'array_item' property on {id}
@@ -2232,13 +2372,3 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
                         f"\nGot: {_json.dumps(response_data, indent=4, sort_keys=True)}"
                     )
         return None
-
-    def _get_response_spec(
-        self, path: str, method: str, status_code: int
-    ) -> Dict[str, Any]:
-        method = method.lower()
-        status = str(status_code)
-        spec: Dict[str, Any] = {**self.openapi_spec}["paths"][path][method][
-            "responses"
-        ][status]
-        return spec
@@ -3,9 +3,11 @@
 import base64
 import datetime
 from copy import deepcopy
+from functools import lru_cache, partial
+from itertools import chain
 from logging import getLogger
-from random import choice, randint, uniform
-from typing import Any, Callable, Dict, List, Optional, Union
+from random import choice, choices, randint, uniform
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import faker
 import rstr
@@ -16,73 +18,146 @@ logger = getLogger(__name__)
 
 IGNORE = object()
 
+PYTHON_TYPE_BY_JSON_TYPE_NAME: Dict[str, Type[Any]] = {
+    "string": str,
+    "boolean": bool,
+    "integer": int,
+    "number": float,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+JSON_TYPE_NAME_BY_PYTHON_TYPE: Dict[Type[Any], str] = {
+    python_type: type_name
+    for type_name, python_type in PYTHON_TYPE_BY_JSON_TYPE_NAME.items()
+}
+
+INT32_BOUNDS: Tuple[int, int] = (-2147483648, 2147483647)
+INT64_BOUNDS: Tuple[int, int] = (-9223372036854775808, 9223372036854775807)
+
+
+PROVIDER_METHOD_BY_NAME: Dict[str, str] = {
+    "date": "date",
+    "date_time": "date_time",
+    "password": "password",
+    "binary": "binary",
+    "email": "safe_email",
+    "uuid": "uuid4",
+    "uri": "uri",
+    "url": "url",
+    "hostname": "hostname",
+    "ipv4": "ipv4",
+    "ipv6": "ipv6",
+    "name": "name",
+    "text": "text",
+    "description": "text",
+}
+
+
+def _generate(fake: faker.Faker, provider_method: str) -> Any:
+    return getattr(fake, provider_method)()
+
 
 class LocalizedFaker:
     """Class to support setting a locale post-init."""
 
     # pylint: disable=missing-function-docstring
     def __init__(self) -> None:
-        self.fake = faker.Faker()
+        self._fake: Optional[faker.Faker] = None
+        self._bound_generators: Optional[Dict[str, Callable[[], Any]]] = None
+
+    @property
+    def fake(self) -> faker.Faker:
+        # Creating a Faker instance loads its providers, so this is done on first use
+        if self._fake is None:
+            self._fake = faker.Faker()
+        return self._fake
 
     def set_locale(self, locale: Union[str, List[str]]) -> None:
         """Update the fake attribute with a Faker instance with the provided locale."""
-        self.fake = faker.Faker(locale)
+        self._fake = faker.Faker(locale)
+        self._bound_generators = None
+
+    @property
+    def _generators(self) -> Dict[str, Callable[[], Any]]:
+        if self._bound_generators is None:
+            self._bound_generators = self._get_generators()
+        return self._bound_generators
+
+    def _get_generators(self) -> Dict[str, Callable[[], Any]]:
+        # Resolving a provider method on a Faker instance is relatively expensive,
+        # so the bound methods are looked up once for each Faker instance. With
+        # multiple locales, Faker selects a locale on each lookup so this cannot
+        # be done up front.
+        if len(self.fake.locales) > 1:
+            return {
+                name: partial(_generate, self.fake, provider_method)
+                for name, provider_method in PROVIDER_METHOD_BY_NAME.items()
+            }
+        return {
+            name: getattr(self.fake, provider_method)
+            for name, provider_method in PROVIDER_METHOD_BY_NAME.items()
+        }
+
+    def get_generator(self, name: str) -> Callable[[], Any]:
+        """Return the generator for the name, or the uuid generator if not supported."""
+        return self._generators.get(name, self._generators["uuid"])
 
     @property
     def date(self) -> Callable[[], str]:
-        return self.fake.date
+        return self._generators["date"]
 
     @property
     def date_time(self) -> Callable[[], datetime.datetime]:
-        return self.fake.date_time
+        return self._generators["date_time"]
 
     @property
     def password(self) -> Callable[[], str]:
-        return self.fake.password
+        return self._generators["password"]
 
     @property
     def binary(self) -> Callable[[], bytes]:
-        return self.fake.binary
+        return self._generators["binary"]
 
     @property
     def email(self) -> Callable[[], str]:
-        return self.fake.safe_email
+        return self._generators["email"]
 
     @property
     def uuid(self) -> Callable[[], str]:
-        return self.fake.uuid4
+        return self._generators["uuid"]
 
     @property
     def uri(self) -> Callable[[], str]:
-        return self.fake.uri
+        return self._generators["uri"]
 
     @property
     def url(self) -> Callable[[], str]:
-        return self.fake.url
+        return self._generators["url"]
 
     @property
     def hostname(self) -> Callable[[], str]:
-        return self.fake.hostname
+        return self._generators["hostname"]
 
     @property
     def ipv4(self) -> Callable[[], str]:
-        return self.fake.ipv4
+        return self._generators["ipv4"]
 
     @property
     def ipv6(self) -> Callable[[], str]:
-        return self.fake.ipv6
+        return self._generators["ipv6"]
 
     @property
     def name(self) -> Callable[[], str]:
-        return self.fake.name
+        return self._generators["name"]
 
     @property
     def text(self) -> Callable[[], str]:
-        return self.fake.text
+        return self._generators["text"]
 
     @property
     def description(self) -> Callable[[], str]:
-        return self.fake.text
+        return self._generators["description"]
 
 
 FAKE = LocalizedFaker()
@@ -90,53 +165,34 @@ FAKE = LocalizedFaker()
 
 def json_type_name_of_python_type(python_type: Any) -> str:
     """Return the JSON type name for supported Python types."""
-    if python_type == str:
-        return "string"
-    if python_type == bool:
-        return "boolean"
-    if python_type == int:
-        return "integer"
-    if python_type == float:
-        return "number"
-    if python_type == list:
-        return "array"
-    if python_type == dict:
-        return "object"
-    if python_type == type(None):
-        return "null"
-    raise ValueError(f"No json type mapping for Python type {python_type} available.")
+    try:
+        return JSON_TYPE_NAME_BY_PYTHON_TYPE[python_type]
+    except KeyError:
+        raise ValueError(
+            f"No json type mapping for Python type {python_type} available."
+        ) from None
 
 
 def python_type_by_json_type_name(type_name: str) -> Any:
     """Return the Python type based on the JSON type name."""
-    if type_name == "string":
-        return str
-    if type_name == "boolean":
-        return bool
-    if type_name == "integer":
-        return int
-    if type_name == "number":
-        return float
-    if type_name == "array":
-        return list
-    if type_name == "object":
-        return dict
-    if type_name == "null":
-        return type(None)
-    raise ValueError(f"No Python type mapping for JSON type '{type_name}' available.")
+    try:
+        return PYTHON_TYPE_BY_JSON_TYPE_NAME[type_name]
+    except KeyError:
+        raise ValueError(
+            f"No Python type mapping for JSON type '{type_name}' available."
+        ) from None
 
 
 def get_valid_value(value_schema: Dict[str, Any]) -> Any:
     """Return a random value that is valid under the provided value_schema."""
-    value_schema = deepcopy(value_schema)
-
     if value_schema.get("types"):
         value_schema = choice(value_schema["types"])
 
+    # values taken from the schema are copied, since the caller may modify them
     if (from_const := value_schema.get("const")) is not None:
-        return from_const
+        return deepcopy(from_const)
     if from_enum := value_schema.get("enum"):
-        return choice(from_enum)
+        return deepcopy(choice(from_enum))
 
     value_type = value_schema["type"]
 
@@ -161,21 +217,20 @@ def get_invalid_value(
     values_from_constraint: Optional[List[Any]] = None,
 ) -> Any:
     """Return a random value that violates the provided value_schema."""
-    value_schema = deepcopy(value_schema)
-
     if value_schemas := value_schema.get("types"):
         if len(value_schemas) > 1:
             value_schemas = [
                 schema for schema in value_schemas if schema["type"] != "null"
             ]
-        value_schema = choice(value_schemas)
+        # commonly only a single schema remains once "null" is filtered out
+        if len(value_schemas) == 1:
+            value_schema = value_schemas[0]
+        else:
+            value_schema = choice(value_schemas)
 
     invalid_value: Any = None
     value_type = value_schema["type"]
 
-    if not isinstance(current_value, python_type_by_json_type_name(value_type)):
-        current_value = get_valid_value(value_schema=value_schema)
-
     if (
         values_from_constraint
         and (
@@ -191,11 +246,14 @@ def get_invalid_value(
     if enum_values := value_schema.get("enum"):
         if (
             invalid_value := get_invalid_value_from_enum(
-                values=enum_values, value_type=value_type
+                values=deepcopy(enum_values), value_type=value_type
             )
         ) is not None:
             return invalid_value
-    # Violate min / max values or length if possible
+    # Violate min / max values or length if possible; only this requires a valid
+    # current_value, so a new one is only generated when that point is reached
+    if not isinstance(current_value, python_type_by_json_type_name(value_type)):
+        current_value = get_valid_value(value_schema=value_schema)
     if (
         invalid_value := get_value_out_of_bounds(
             value_schema=value_schema, current_value=current_value
@@ -215,13 +273,10 @@ def get_invalid_value(
 def get_random_int(value_schema: Dict[str, Any]) -> int:
     """Generate a random int within the min/max range of the schema, if specified."""
     # Use int32 integers if "format" does not specify int64
-    property_format = value_schema.get("format", "int32")
-    if property_format == "int64":
-        min_int = -9223372036854775808
-        max_int = 9223372036854775807
+    if value_schema.get("format") == "int64":
+        min_int, max_int = INT64_BOUNDS
     else:
-        min_int = -2147483648
-        max_int = 2147483647
+        min_int, max_int = INT32_BOUNDS
     # OAS 3.0: exclusiveMinimum/Maximum is a bool in combination with minimum/maximum
     # OAS 3.1: exclusiveMinimum/Maximum is an integer
     minimum = value_schema.get("minimum", min_int)
@@ -294,31 +349,47 @@ def get_random_string(value_schema: Dict[str, Any]) -> Union[bytes, str]:
     # if a pattern is provided, format and min/max length can be ignored
     if pattern := value_schema.get("pattern"):
         return rstr.xeger(pattern)
+    format_ = value_schema.get("format", "uuid")
+    # a uuid is 36 characters, so without length constraints it can be used as is
+    if (
+        format_ == "uuid"
+        and "minLength" not in value_schema
+        and "maxLength" not in value_schema
+    ):
+        return FAKE.uuid()
     minimum = value_schema.get("minLength", 0)
     maximum = value_schema.get("maxLength", 36)
     if minimum > maximum:
         maximum = minimum
-    format_ = value_schema.get("format", "uuid")
     # byte is a special case due to the required encoding
     if format_ == "byte":
         data = FAKE.uuid()
         return base64.b64encode(data.encode("utf-8"))
     value = fake_string(string_format=format_)
-    while len(value) < minimum:
+    if (missing_length := minimum - len(value)) > 0:
         # use fake.name() to ensure the returned string uses the provided locale
-        value = value + FAKE.name()
+        names: List[str] = []
+        while missing_length > 0:
+            name = FAKE.name()
+            names.append(name)
+            missing_length -= len(name)
+        value += "".join(names)
     if len(value) > maximum:
         value = value[:maximum]
     return value
 
 
+@lru_cache(maxsize=None)
+def _get_generator_name(string_format: str) -> str:
+    # format names may contain -, which is invalid in Python naming
+    return string_format.replace("-", "_")
+
+
 def fake_string(string_format: str) -> str:
     """
     Generate a random string based on the provided format if the format is supported.
     """
-    # format names may contain -, which is invalid in Python naming
-    string_format = string_format.replace("-", "_")
-    fake_generator = getattr(FAKE, string_format, FAKE.uuid)
+    fake_generator = FAKE.get_generator(_get_generator_name(string_format))
     value: str = fake_generator()
     if isinstance(value, datetime.datetime):
         return value.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -332,11 +403,7 @@ def get_random_array(value_schema: Dict[str, Any]) -> List[Any]:
     if minimum > maximum:
         maximum = minimum
     items_schema = value_schema["items"]
-    value = []
-    for _ in range(maximum):
-        item_value = get_valid_value(items_schema)
-        value.append(item_value)
-    return value
+    return [get_valid_value(items_schema) for _ in range(maximum)]
 
 
 def get_invalid_value_from_constraint(
@@ -356,15 +423,14 @@ def get_invalid_value_from_constraint(
         return not values_from_constraint[0]
     # for unsupported types or empty constraints lists return None
     if (
-        value_type not in ["string", "integer", "number", "array", "object"]
+        value_type not in {"string", "integer", "number", "array", "object"}
         or not values_from_constraint
     ):
         return None
 
-    values_from_constraint = deepcopy(values_from_constraint)
     # for objects, keep the keys intact but update the values
     if value_type == "object":
-        valid_object = values_from_constraint.pop()
+        valid_object = values_from_constraint[-1]
         invalid_object = {}
         for key, value in valid_object.items():
             python_type_of_value = type(value)
@@ -377,7 +443,7 @@ def get_invalid_value_from_constraint(
 
     # for arrays, update each value in the array to a value of the same type
     if value_type == "array":
-        valid_array = values_from_constraint.pop()
+        valid_array = values_from_constraint[-1]
         invalid_array = []
         for value in valid_array:
             python_type_of_value = type(value)
@@ -389,51 +455,51 @@ def get_invalid_value_from_constraint(
             invalid_array.append(invalid_value)
         return invalid_array
 
-    invalid_values = 2 * values_from_constraint
-    invalid_value = invalid_values.pop()
-    if value_type in ["integer", "number"]:
-        for value in invalid_values:
-            invalid_value = abs(invalid_value) + abs(value)
+    if value_type in {"integer", "number"}:
+        invalid_value = 2 * sum(abs(value) for value in values_from_constraint)
         if not invalid_value:
             invalid_value += 1
         return invalid_value
-    for value in invalid_values:
-        invalid_value = invalid_value + value
+    separator = b"" if isinstance(values_from_constraint[0], bytes) else ""
+    invalid_value = separator.join(values_from_constraint) * 2
     # None for empty string
     return invalid_value if invalid_value else None
 
 
+def _freeze(value: Any) -> Any:
+    """Return a hashable representation of a (nested) dict / list value."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 def get_invalid_value_from_enum(values: List[Any], value_type: str) -> Any:
     """Return a value not in the enum by combining the enum values."""
+    # repeat each value in the combination to ensure single-item enums are invalidated
     if value_type == "string":
-        invalid_value: Any = ""
-    elif value_type in ["integer", "number"]:
-        invalid_value = 0
-    elif value_type == "array":
-        invalid_value = []
-    elif value_type == "object":
-        # force creation of a new object since we will be modifying it
-        invalid_value = {**values[0]}
-    else:
+        return "".join(value + value for value in values)
+    if value_type in {"integer", "number"}:
+        return 2 * sum(abs(value) for value in values)
+    if value_type == "array":
+        return list(chain.from_iterable(value + value for value in values))
+    if value_type != "object":
         logger.warning(f"Cannot invalidate enum value with type {value_type}")
         return None
+
+    # objects are a special case, since they must be of the same type / class
+    # invalid_value.update(value) will end up with the last value in the list,
+    # which is a valid value, so another approach is needed
+    # force creation of a new object since we will be modifying it
+    invalid_value = {**values[0]}
+    # compare frozen forms to avoid a scan of the enum values after each update
+    frozen_values = {_freeze(value) for value in values}
     for value in values:
-        # repeat each addition to ensure single-item enums are invalidated
-        if value_type in ["integer", "number"]:
-            invalid_value += abs(value) + abs(value)
-        if value_type == "string":
-            invalid_value += value + value
-        if value_type == "array":
-            invalid_value.extend(value)
-            invalid_value.extend(value)
-        # objects are a special case, since they must be of the same type / class
-        # invalid_value.update(value) will end up with the last value in the list,
-        # which is a valid value, so another approach is needed
-        if value_type == "object":
-            for key in invalid_value.keys():
-                invalid_value[key] = value.get(key)
-                if invalid_value not in values:
-                    return invalid_value
+        for key in invalid_value.keys():
+            invalid_value[key] = value.get(key)
+            if _freeze(invalid_value) not in frozen_values:
+                return invalid_value
     return invalid_value
 
 
@@ -444,7 +510,7 @@ def get_value_out_of_bounds(value_schema: Dict[str, Any], current_value: Any) ->
     """
     value_type = value_schema["type"]
 
-    if value_type in ["integer", "number"]:
+    if value_type in {"integer", "number"}:
         if (minimum := value_schema.get("minimum")) is not None:
             if value_schema.get("exclusiveMinimum") is True:
                 return minimum
@@ -464,8 +530,8 @@ def get_value_out_of_bounds(value_schema: Dict[str, Any], current_value: Any) ->
             return current_value[0 : minimum - 1]
         if (maximum := value_schema.get("maxItems")) is not None:
             invalid_value = current_value if current_value else ["x"]
-            while len(invalid_value) <= maximum:
-                invalid_value.append(choice(invalid_value))
+            if (missing_length := maximum + 1 - len(invalid_value)) > 0:
+                invalid_value.extend(choices(invalid_value, k=missing_length))
             return invalid_value
     if value_type == "string":
         # if there is a minimum length, send 1 character less
@@ -475,7 +541,7 @@ def get_value_out_of_bounds(value_schema: Dict[str, Any], current_value: Any) ->
         if maximum := value_schema.get("maxLength"):
             invalid_value = current_value if current_value else "x"
             # add random characters from the current value to prevent adding new characters
-            while len(invalid_value) <= maximum:
-                invalid_value += choice(invalid_value)
+            if (missing_length := maximum + 1 - len(invalid_value)) > 0:
+                invalid_value += "".join(choices(invalid_value, k=missing_length))
             return invalid_value
     return None
@@ -1,3 +1,5 @@
+import logging
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -5,7 +7,6 @@ import rich_click as click
 
 from roboswag import __version__ as version
 from roboswag.auth import AUTH_BACKENDS
-from roboswag.generate import generate_libraries
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
@@ -77,4 +78,21 @@ def cli():
 )
 def generate(spec: str, output_dir: Optional[Path] = None, auth: Optional[Path] = None):
     """Generate Python libraries."""
-    generate_libraries(spec, output_dir, auth)
+    # imported here so prance and its dependencies are only loaded when generating
+    from roboswag.generate import (  # pylint: disable=import-outside-toplevel
+        generate_libraries,
+    )
+
+    # the generator reports its progress through the roboswag logger; the handler is
+    # attached per invocation so it writes to the stdout of that invocation
+    logger = logging.getLogger("roboswag")
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    previous_level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        generate_libraries(spec, output_dir, auth)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
@@ -1,20 +1,27 @@
 import json
+from logging import getLogger
 from pathlib import Path
 from typing import Any, Optional
 
 import black
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader
 
 from roboswag.generate.models.api import (
     get_definitions_from_swagger,
     parse_swagger_specification,
 )
 
+logger = getLogger(__name__)
+
+# The templates are loaded and compiled once and reused for every generated file
+TEMPLATE_ENVIRONMENT = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / "templates"), auto_reload=False
+)
+
 
 class LibraryGenerator:
     def __init__(self, source, output: Optional[Path], authentication):
         self.source = source
-        self.parent_dir = Path(__file__).parent
         api_model, swagger = parse_swagger_specification(self.source)
         self.api_model = api_model
         self.swagger = swagger
@@ -43,15 +50,11 @@ class LibraryGenerator:
 
     def generate_init(self):
         swagger_version = self.swagger.get("openapi") or self.swagger.get("swagger")
-        api_init_template = self.parent_dir / "templates" / "api_init.jinja"
-        with open(api_init_template) as f:
-            template = Template(f.read()).render(
-                swagger_version=swagger_version, infos=self.swagger["info"]
-            )
         init_file = self.output_dir / "__init__.py"
-        with open(init_file, "w") as f:
-            f.write(template)
-        print(f"Generated '{init_file}' file")
+        TEMPLATE_ENVIRONMENT.get_template("api_init.jinja").stream(
+            swagger_version=swagger_version, infos=self.swagger["info"]
+        ).dump(str(init_file), encoding="utf-8")
+        logger.info(f"Generated '{init_file}' file")
         self.unformatted_files.append(init_file)
 
     def get_api_auth(self):
@@ -64,49 +67,43 @@ class LibraryGenerator:
     def generate_endpoints(self):
         endpoints_dir = self.output_dir / "endpoints"
         Path(endpoints_dir).mkdir(exist_ok=True)
-        print("Generating endpoints...")
+        logger.info("Generating endpoints...")
+        paths_template = TEMPLATE_ENVIRONMENT.get_template("paths.jinja")
         for tag in self.api_model.tags.values():
-            paths_template = self.parent_dir / "templates" / "paths.jinja"
-            with open(paths_template) as f:
-                template = Template(f.read()).render(
-                    class_name=tag.name,
-                    authentication=self.get_api_auth(),
-                    endpoints=tag.endpoints,
-                    description=tag.description,
-                )
             endpoint_file = endpoints_dir / f"{tag.name}.py"
-            with open(endpoint_file, "w") as f:
-                f.write(template)
-            print(f"Generated '{endpoint_file}' file")
+            paths_template.stream(
+                class_name=tag.name,
+                authentication=self.get_api_auth(),
+                endpoints=tag.endpoints,
+                description=tag.description,
+            ).dump(str(endpoint_file), encoding="utf-8")
+            logger.info(f"Generated '{endpoint_file}' file")
             self.unformatted_files.append(endpoint_file)
 
     def generate_models(self):
         models_dir = self.output_dir / "models"
         Path(models_dir).mkdir(exist_ok=True)
-        print("Generating models...")
+        logger.info("Generating models...")
+        models_template = TEMPLATE_ENVIRONMENT.get_template("models.jinja")
         for definition in self.api_model.definitions.values():
-            models_template = self.parent_dir / "templates" / "models.jinja"
-            with open(models_template) as f:
-                template = Template(f.read()).render(
-                    class_name=definition.name, properties=definition.properties
-                )
             model_file = models_dir / f"{definition.name}.py"
-            with open(model_file, "w") as f:
-                f.write(template)
-            print(f"Generated '{model_file}' file")
+            models_template.stream(
+                class_name=definition.name, properties=definition.properties
+            ).dump(str(model_file), encoding="utf-8")
+            logger.info(f"Generated '{model_file}' file")
             self.unformatted_files.append(model_file)
 
     def generate_schemas(self):
         schemas_dir = self.output_dir / "schemas"
         Path(schemas_dir).mkdir(exist_ok=True)
-        print("Generating schemas...")
+        logger.info("Generating schemas...")
         schemas = get_definitions_from_swagger(self.swagger)
         for schema_name, schema in schemas.items():
             schema_file = schemas_dir / f"{schema_name}.json"
             with open(schema_file, "w") as f:
-                f.write(json.dumps(schema, indent=4))
+                json.dump(schema, f, indent=4)
                 f.write("\n")
-            print(f"Generated '{schema_file}' file")
+            logger.info(f"Generated '{schema_file}' file")
             self.unformatted_files.append(schema_file)
 
 
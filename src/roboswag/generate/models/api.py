@@ -16,6 +16,11 @@ from roboswag.generate.models.response import Response
 from roboswag.generate.models.tag import Tag
 from roboswag.generate.models.utils import get_python_type, pythonify_name
 
+# split on camelCase and / path
+PATH_PARTS_PATTERN = re.compile("((?<=[a-z])(?=[A-Z])|/)")
+# remove / and path parameter braces, replace - to get valid Python names
+PATH_PART_TRANSLATION = str.maketrans({"/": None, "{": None, "}": None, "-": "_"})
+
 
 def get_schema(param):
     return param.get("schema") or get_schema_openapi_v3(param)
@@ -70,12 +75,10 @@ class APIModel:
     def get_unique_endpoint_name(self, path, method, method_body):
         if "operationId" in method_body:
             return pythonify_name(method_body["operationId"])
-        # split on camelCase and / path
-        parts = re.split("((?<=[a-z])(?=[A-Z])|/)", path)
+        parts = PATH_PARTS_PATTERN.split(path)
         name = method
         for part in parts:
-            part = re.sub("[/{}]", "", part)
-            part = part.replace("-", "_")
+            part = part.translate(PATH_PART_TRANSLATION)
             if not part:
                 continue
             name += f"_{part.lower()}"
@@ -88,7 +91,8 @@ class APIModel:
     @staticmethod
     def class_name_from_path(path, **kwargs):
         for part in path.split("/"):
-            part = re.sub("[/{}]", "", part)
+            # no / left after the split, so only the braces are removed
+            part = part.replace("{", "").replace("}", "")
             if not part:
                 continue
             return part.title()
@@ -11,6 +11,8 @@ class Property:
     def __init__(self, name: str, prop_type=None):
         self.name: str = replace_reserved_name(pythonify_name(name))
         self.type = prop_type
+        # resolved once here instead of on every render of the models template
+        self.type_name: str = getattr(prop_type, "__name__", "")
 
 
 class Definition:
@@ -53,16 +53,16 @@ class Endpoint:
         line = f"    def {self.method_name}(self"
         prefix = len(line) - 4
         last_index = len(args) - 1
-        method_sig = ""
+        lines = []
         for index, arg in enumerate(args):
             if not arg:
                 continue
             if len(line) + len(arg) + 2 > max_line_length - (
                 2 if last_index == index else 0
             ):
-                method_sig += line
+                lines.append(line)
                 line = ",\n" + prefix * " " + arg
             else:
                 line += f", {arg}"
-        method_sig += line
-        return method_sig
+        lines.append(line)
+        return "".join(lines)
@@ -2,6 +2,16 @@ from roboswag.generate.models.utils import pythonify_name
 
 
 class Parameter:
+    __slots__ = (
+        "name",
+        "python_name",
+        "default",
+        "param_type",
+        "description",
+        "required",
+        "schema",
+    )
+
     def __init__(
         self,
         name: str,
@@ -1,9 +1,11 @@
 import datetime
 import re
 import uuid
+from functools import lru_cache
 from typing import Dict
 
 RESERVED_WORDS = {"global", "cls", "self"}
+CAPITALIZED_WORD_PATTERN = re.compile("([A-Z][a-z]+)")
 
 types_mapping = {
     "string": {
@@ -34,17 +36,19 @@ types_mapping = {
 def get_python_type(param_type, param_format=None):
     if not param_type:
         return str
-    if not types_mapping[param_type]:
+    python_type = types_mapping[param_type]
+    if not python_type:
         return str
-    if not isinstance(types_mapping[param_type], Dict):
-        return types_mapping[param_type]
+    if not isinstance(python_type, Dict):
+        return python_type
     if param_format:
-        return types_mapping[param_type][param_format]
+        return python_type[param_format]
     return str
 
 
+@lru_cache(maxsize=None)
 def pythonify_name(name: str, join_mark: str = "_", join_fn: str = "lower") -> str:
-    names = re.split("([A-Z][a-z]+)", name)
+    names = CAPITALIZED_WORD_PATTERN.split(name)
     if join_fn == "lower":
         name = join_mark.join(name.lower() for name in names if name.strip())
     elif join_fn == "title":
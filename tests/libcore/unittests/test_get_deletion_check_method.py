@@ -0,0 +1,19 @@
+# pylint: disable="missing-class-docstring", "missing-function-docstring"
+import unittest
+
+from OpenApiLibCore.openapi_libcore import _get_deletion_check_method
+
+
+class TestGetDeletionCheckMethod(unittest.TestCase):
+    def test_head_if_supported(self) -> None:
+        path_item = {"get": {}, "head": {}, "delete": {}}
+        self.assertEqual(_get_deletion_check_method(path_item), "HEAD")
+
+    def test_get_fallback(self) -> None:
+        path_item = {"get": {}, "delete": {}}
+        self.assertEqual(_get_deletion_check_method(path_item), "GET")
+        self.assertEqual(_get_deletion_check_method({}), "GET")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# pylint: disable="missing-class-docstring", "missing-function-docstring"
+import pathlib
+import unittest
+from copy import deepcopy
+
+from OpenApiLibCore import OpenApiLibCore
+from OpenApiLibCore.openapi_libcore import _resolve_response_details
+
+unittest_folder = pathlib.Path(__file__).parent.resolve()
+spec_path = (
+    unittest_folder.parent.parent / "files" / "petstore_openapi.json"
+).as_posix()
+
+
+class TestResolveResponseDetails(unittest.TestCase):
+    def test_no_content(self) -> None:
+        details = _resolve_response_details({"description": "No content"})
+        self.assertEqual(details.content_types, [])
+        self.assertEqual(details.content_type, "")
+
+    def test_unsupported_content(self) -> None:
+        details = _resolve_response_details({"content": {"application/xml": {}}})
+        self.assertEqual(details.content_types, ["application/xml"])
+        self.assertEqual(details.content_type, "")
+
+    def test_json_content(self) -> None:
+        response_spec = {
+            "content": {
+                "application/xml": {},
+                "application/json; charset=utf-8": {
+                    "schema": {"allOf": [{"type": "object"}, {"required": ["id"]}]}
+                },
+            }
+        }
+        details = _resolve_response_details(response_spec)
+        self.assertEqual(
+            details.content_types,
+            ["application/xml", "application/json; charset=utf-8"],
+        )
+        self.assertEqual(details.content_type, "application/json; charset=utf-8")
+        self.assertEqual(details.mime_type, "application/json")
+        self.assertEqual(details.schema, {"type": "object", "required": ["id"]})
+
+
+class TestGetResponseDetailsForOperation(unittest.TestCase):
+    def test_details_are_resolved_on_first_use(self) -> None:
+        library = OpenApiLibCore(source=spec_path)
+        self.assertEqual(library._response_details, {})
+
+        details = library._get_response_details(
+            path="/pet/{petId}", method="GET", status_code=200
+        )
+        self.assertEqual(details.mime_type, "application/json")
+        self.assertEqual(
+            list(library._response_details.keys()), [("/pet/{petId}", "get", "200")]
+        )
+        self.assertIs(
+            library._get_response_details(
+                path="/pet/{petId}", method="get", status_code=200
+            ),
+            details,
+        )
+
+    def test_other_responses_are_not_resolved(self) -> None:
+        library = OpenApiLibCore(source=spec_path)
+        # work on a copy; the parsed spec is shared through the PARSER_CACHE
+        library._openapi_spec = deepcopy(library._openapi_spec)
+        # additionalProperties: true cannot be merged with a schema-typed value
+        unresolvable_schema = {
+            "allOf": [
+                {"type": "object", "additionalProperties": True},
+                {"type": "object", "additionalProperties": {"type": "string"}},
+            ]
+        }
+        inventory_responses = library._openapi_spec["paths"]["/store/inventory"]["get"][
+            "responses"
+        ]
+        inventory_responses["200"]["content"]["application/json"][
+            "schema"
+        ] = unresolvable_schema
+
+        details = library._get_response_details(
+            path="/pet/{petId}", method="GET", status_code=200
+        )
+        self.assertEqual(details.mime_type, "application/json")
+        self.assertEqual(
+            list(library._response_details.keys()), [("/pet/{petId}", "get", "200")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# pylint: disable="missing-class-docstring", "missing-function-docstring"
+import pathlib
+import unittest
+from typing import Any, List
+
+from openapi_core.templating.paths.exceptions import ServerNotFound
+from requests import Request, Response
+from robot.api.exceptions import Failure
+
+from OpenApiLibCore import OpenApiLibCore
+
+unittest_folder = pathlib.Path(__file__).parent.resolve()
+spec_path = (
+    unittest_folder.parent.parent / "files" / "petstore_openapi.json"
+).as_posix()
+
+
+def get_response(status_code: int) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.request = Request("GET", "http://localhost/pet/1").prepare()
+    return response
+
+
+class TestValidateResponseAgainstSpec(unittest.TestCase):
+    def get_library(self, **kwargs: Any) -> OpenApiLibCore:
+        library = OpenApiLibCore(source=spec_path, **kwargs)
+        self.validated: List[int] = []
+
+        def validate_response_vs_spec(request: Any, response: Any) -> None:
+            self.validated.append(response.status_code)
+
+        library.validate_response_vs_spec = validate_response_vs_spec  # type: ignore[method-assign]
+        return library
+
+    def test_disabled_skips_validation(self) -> None:
+        library = self.get_library(response_validation="DISABLED")
+        library._validate_response_against_spec(get_response(200))
+        self.assertEqual(self.validated, [])
+
+    def test_disabled_validates_invalid_property_default_response(self) -> None:
+        library = self.get_library(response_validation="DISABLED")
+        library._validate_response_against_spec(get_response(422))
+        self.assertEqual(self.validated, [422])
+
+    def test_enabled_validates(self) -> None:
+        library = self.get_library(response_validation="WARN")
+        library._validate_response_against_spec(get_response(200))
+        self.assertEqual(self.validated, [200])
+
+    def test_server_not_found_does_not_skip_later_validations(self) -> None:
+        library = self.get_library(disable_server_validation=True)
+
+        def raise_server_not_found(request: Any, response: Any) -> None:
+            raise ServerNotFound(url=request.host_url)
+
+        library.validate_response_vs_spec = raise_server_not_found  # type: ignore[method-assign]
+        library._validate_response_against_spec(get_response(200))
+
+        validated: List[int] = []
+        library.validate_response_vs_spec = (  # type: ignore[method-assign]
+            lambda request, response: validated.append(response.status_code)
+        )
+        library._validate_response_against_spec(get_response(200))
+        self.assertEqual(validated, [200])
+
+    def test_disabled_undocumented_status_code(self) -> None:
+        library = OpenApiLibCore(source=spec_path, response_validation="DISABLED")
+        with self.assertRaisesRegex(Failure, "Unknown response http status: 418"):
+            library.validate_response(path="/pet/{petId}", response=get_response(418))
+
+    def test_disabled_undocumented_path(self) -> None:
+        library = OpenApiLibCore(source=spec_path, response_validation="DISABLED")
+        with self.assertRaisesRegex(Failure, "Path not found for /unknown"):
+            library.validate_response(path="/unknown", response=get_response(200))
+
+
+if __name__ == "__main__":
+    unittest.main()
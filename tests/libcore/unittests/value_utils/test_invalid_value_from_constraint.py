@@ -70,6 +70,30 @@ class TestInvalidValueFromConstraint(unittest.TestCase):
         )
         self.assertEqual(value, None)
 
+    def test_bytes(self) -> None:
+        values = [b"foo"]
+        value = value_utils.get_invalid_value_from_constraint(
+            values_from_constraint=values,
+            value_type="string",
+        )
+        self.assertNotIn(value, values)
+        self.assertIsInstance(value, bytes)
+
+        values = [b"foo", b"bar", b"baz"]
+        value = value_utils.get_invalid_value_from_constraint(
+            values_from_constraint=values,
+            value_type="string",
+        )
+        self.assertNotIn(value, values)
+        self.assertIsInstance(value, bytes)
+
+        values = [b""]
+        value = value_utils.get_invalid_value_from_constraint(
+            values_from_constraint=values,
+            value_type="string",
+        )
+        self.assertEqual(value, None)
+
     def test_integer(self) -> None:
         values = [0]
         value = value_utils.get_invalid_value_from_constraint(
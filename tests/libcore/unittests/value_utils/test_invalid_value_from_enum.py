@@ -1,4 +1,5 @@
 # pylint: disable="missing-class-docstring", "missing-function-docstring"
+import datetime
 import unittest
 
 from OpenApiLibCore import value_utils
@@ -61,6 +62,23 @@ class TestInvalidValueFromEnum(unittest.TestCase):
         )
         self.assertNotIn(result, value_list)
 
+    def test_object_with_non_json_values(self) -> None:
+        value_list = [
+            {
+                "date": datetime.date(2020, 1, 1),
+                "tags": ["foo", "bar"],
+            },
+            {
+                "date": datetime.date(2021, 1, 1),
+                "tags": ["spam", "ham"],
+            },
+        ]
+        result = value_utils.get_invalid_value_from_enum(
+            values=value_list,
+            value_type="object",
+        )
+        self.assertNotIn(result, value_list)
+
     def test_unsupported(self) -> None:
         value_list = [True, False]
         result = value_utils.get_invalid_value_from_enum(
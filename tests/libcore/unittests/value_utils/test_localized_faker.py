@@ -37,6 +37,15 @@ class TestLocalizedFaker(unittest.TestCase):
         self.assertIsInstance(faker.text(), str)
         self.assertIsInstance(faker.description(), str)
 
+    def test_get_generator(self) -> None:
+        faker = value_utils.LocalizedFaker()
+
+        self.assertIsInstance(faker.get_generator("ipv4")(), str)
+        self.assertEqual(faker.get_generator("unsupported"), faker.uuid)
+
+        faker.set_locale(["nl_NL", "zh_TW"])
+        self.assertIsInstance(faker.get_generator("name")(), str)
+
 
 if __name__ == "__main__":
     unittest.main()